@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
 import json
 import base64
+import gzip
 import hashlib
 import hmac
+import html
 import time
 import secrets
+import signal
+import re
 import urllib.parse
 import subprocess
+import tempfile
 import os
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 
 # RSA key components (generated with openssl)
@@ -55,6 +61,74 @@ PUBLIC_KEY_JWK = {
     "e": RSA_E
 }
 
+# OAuth discovery metadata
+DISCOVERY = {
+    "issuer": "http://localhost:9000",
+    "authorization_endpoint": "http://localhost:9000/authorize",
+    "token_endpoint": "http://localhost:9000/token",
+    "jwks_uri": "http://localhost:9000/.well-known/jwks.json",
+    "registration_endpoint": "http://localhost:9000/register",
+    "response_types_supported": ["code"],
+    "grant_types_supported": ["authorization_code", "refresh_token"],
+    "token_endpoint_auth_methods_supported": ["client_secret_basic", "client_secret_post"],
+    "code_challenge_methods_supported": ["S256"]
+}
+
+def encode_static_json(data):
+    """Encode a constant JSON document, returning (body, gzip_body, etag)"""
+    body = json.dumps(data, separators=(',', ':')).encode('utf-8')
+    # Compression only happens once, so spend the extra CPU for the best ratio
+    gzip_body = gzip.compress(body, compresslevel=9)
+    etag = hashlib.md5(body).hexdigest()
+    return body, gzip_body, etag
+
+# The JWKS and discovery documents never change, so encode them once up front
+JWKS_BODY = encode_static_json({"keys": [PUBLIC_KEY_JWK]})
+DISCOVERY_BODY = encode_static_json(DISCOVERY)
+
+# Bodies for the OAuth errors that carry no description, encoded once
+OAUTH_ERROR_BODIES = {
+    error: json.dumps({"error": error}, separators=(',', ':')).encode('utf-8')
+    for error in ("invalid_client", "invalid_grant", "unsupported_grant_type", "unsupported_response_type")
+}
+
+def split_template(text, fields):
+    """Split a $name template into alternating encoded literals and field names
+
+    $$ stands for a literal $. The template must use exactly the given fields,
+    so a stray $name fails at import instead of on every render.
+    """
+    parts = ['']
+    for index, part in enumerate(re.split(r'\$(\$|\w+)', text)):
+        if index % 2 == 0 or part == '$':
+            parts[-1] += part
+        else:
+            parts += [part, '']
+
+    used = set(parts[1::2])
+    if used != set(fields):
+        raise ValueError(f"template fields {sorted(used)} do not match {sorted(fields)}")
+
+    return [
+        part.encode('utf-8') if index % 2 == 0 else part
+        for index, part in enumerate(parts)
+    ]
+
+def render_template(segments, **values):
+    """Fill a template produced by split_template, returning UTF-8 bytes"""
+    return b''.join(
+        segment if index % 2 == 0 else values[segment].encode('utf-8')
+        for index, segment in enumerate(segments)
+    )
+
+# Authorization consent page, read and split around its fields once at import
+AUTHORIZATION_PAGE = split_template(
+    (Path(__file__).parent / 'authorize.html').read_text(encoding='utf-8'),
+    fields=('client_id', 'callback_url'))
+
+# Largest request body accepted by the POST endpoints
+MAX_BODY_SIZE = 64 * 1024
+
 # In-memory storage
 registered_clients = {}
 authorization_codes = {}
@@ -71,121 +145,265 @@ def base64url_encode(data):
         data = data.encode('utf-8')
     return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
 
-def create_jwt_with_openssl(payload):
-    """Create a JWT using openssl command for RS256 signing"""
-    # Header
-    header = {
-        "typ": "JWT",
-        "alg": "RS256",
-        "kid": "key-1"
-    }
+# Every token shares the same header, so it only needs encoding once
+ENCODED_JWT_HEADER = base64url_encode(json.dumps({
+    "typ": "JWT",
+    "alg": "RS256",
+    "kid": "key-1"
+}, separators=(',', ':')))
+
+def write_private_key():
+    """Write the signing key to a temp file for openssl, returning its path"""
+    fd, key_path = tempfile.mkstemp(suffix='.pem')
+    with os.fdopen(fd, 'w') as f:
+        f.write(PRIVATE_KEY_PEM)
+    return key_path
 
-    # Encode header and payload
-    encoded_header = base64url_encode(json.dumps(header, separators=(',', ':')))
+def create_jwt_with_openssl(payload, key_path):
+    """Create a JWT using openssl command for RS256 signing"""
+    # Encode payload; the header is constant and encoded up front
     encoded_payload = base64url_encode(json.dumps(payload, separators=(',', ':')))
 
     # Create the signing input
-    signing_input = f"{encoded_header}.{encoded_payload}"
+    signing_input = f"{ENCODED_JWT_HEADER}.{encoded_payload}"
 
-    # Write private key to temp file
-    with open('/tmp/jwt_private_key.pem', 'w') as f:
-        f.write(PRIVATE_KEY_PEM)
+    # Use openssl to sign
+    process = subprocess.run([
+        'openssl', 'dgst', '-sha256', '-sign', key_path
+    ], input=signing_input.encode(), capture_output=True)
 
-    try:
-        # Use openssl to sign
-        process = subprocess.run([
-            'openssl', 'dgst', '-sha256', '-sign', '/tmp/jwt_private_key.pem'
-        ], input=signing_input.encode(), capture_output=True)
+    if process.returncode != 0:
+        raise Exception(f"OpenSSL signing failed: {process.stderr.decode()}")
 
-        if process.returncode != 0:
-            raise Exception(f"OpenSSL signing failed: {process.stderr.decode()}")
-
-        signature = base64url_encode(process.stdout)
-        return f"{signing_input}.{signature}"
-
-    finally:
-        # Clean up temp file
-        if os.path.exists('/tmp/jwt_private_key.pem'):
-            os.remove('/tmp/jwt_private_key.pem')
+    signature = base64url_encode(process.stdout)
+    return f"{signing_input}.{signature}"
 
 class AuthServerHandler(BaseHTTPRequestHandler):
+    # Keep connections open between requests so clients don't pay a new TCP
+    # handshake per call; every response must therefore carry Content-Length
+    protocol_version = 'HTTP/1.1'
+    # Drop idle keep-alive connections instead of holding a thread forever
+    timeout = 30
+    # Buffer writes so the status line, headers and body go out in a single
+    # send when the response is flushed, rather than one send per write
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def handle_expect_100(self):
+        """Only invite the client to send a body we are going to read"""
+        if self.command != 'POST':
+            # Nothing but POST accepts a request body here
+            self.reject_request(417, "request body not expected")
+            result = False
+        else:
+            result = self.validate_post() is not None and super().handle_expect_100()
+        # Send the 100 Continue (or the rejection) now instead of leaving it in
+        # the write buffer while the client waits on it
+        self.wfile.flush()
+        return result
+
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
+        if self.has_request_body():
+            self.reject_request(400, "request body not allowed")
+            return
+
         self.send_response(200)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
+        # The preflight answer never changes, so let browsers reuse it instead
+        # of repeating it before every cross-origin POST
+        self.send_header('Access-Control-Max-Age', '86400')
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
-    def send_json_response(self, data, status_code=200):
-        """Send a JSON response with CORS headers"""
+    def send_body(self, body, content_type, status_code=200, headers=None):
+        """Send an already-encoded response body with CORS headers"""
         self.send_response(status_code)
-        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
         self.send_header('Access-Control-Allow-Origin', '*')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode('utf-8'))
+        self.wfile.write(body)
+
+    def accepts_gzip(self):
+        """Check whether the client advertised gzip in Accept-Encoding"""
+        for coding in self.headers.get('Accept-Encoding', '').split(','):
+            name, *params = coding.split(';')
+            if name.strip().lower() != 'gzip':
+                continue
+            qvalue = 1.0
+            for param in params:
+                key, _, value = param.partition('=')
+                if key.strip().lower() == 'q':
+                    try:
+                        qvalue = float(value.strip())
+                    except ValueError:
+                        # An unreadable weight makes only this entry unacceptable
+                        qvalue = 0.0
+            if qvalue > 0:
+                return True
+        return False
+
+    def etag_matches(self, etag):
+        """Check whether If-None-Match names the given ETag"""
+        if_none_match = self.headers.get('If-None-Match', '')
+        # If-None-Match uses weak comparison, so ignore any W/ prefix
+        tags = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+        return '*' in tags or etag in tags
+
+    def send_static_json(self, static):
+        """Send a document produced by encode_static_json"""
+        body, gzip_body, etag = static
+        headers = {'Vary': 'Accept-Encoding', 'Cache-Control': 'public, max-age=3600'}
+        if self.accepts_gzip():
+            body = gzip_body
+            headers['Content-Encoding'] = 'gzip'
+            # Each encoding is a distinct representation and needs its own strong ETag
+            etag += '-gzip'
+        headers['ETag'] = f'"{etag}"'
+
+        if self.etag_matches(headers['ETag']):
+            self.send_response(304)
+            self.send_header('Access-Control-Allow-Origin', '*')
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+
+        self.send_body(body, 'application/json', headers=headers)
+
+    def send_json_response(self, data, status_code=200, headers=None):
+        """Send a JSON response with CORS headers"""
+        # Compact separators skip the pretty-printing work done by indent=2
+        body = json.dumps(data, separators=(',', ':')).encode('utf-8')
+        self.send_body(body, 'application/json', status_code, headers)
+
+    def request_content_length(self):
+        """Return the declared Content-Length, 0 if absent, or None if malformed"""
+        values = self.headers.get_all('Content-Length', [])
+        if not values:
+            return 0
+        # Accept only plain ASCII digits (int() would also take '+14', '1_4'
+        # or non-ASCII digits), so we frame the body exactly as a proxy would
+        value = values[0].strip(' \t')
+        if len(values) > 1 or not (value.isascii() and value.isdigit()):
+            return None
+        return int(value)
+
+    def has_request_body(self):
+        """Check whether the request declares a body of any kind"""
+        return ('Transfer-Encoding' in self.headers or
+                self.request_content_length() != 0)
+
+    def reject_request(self, status_code, description):
+        """Reject a request without reading its body, closing the connection"""
+        # Any unread body bytes would otherwise be parsed as the next request
+        # on this connection; sending Connection: close also sets
+        # close_connection so the server hangs up after this response
+        self.send_json_response(
+            {"error": "invalid_request", "error_description": description},
+            status_code,
+            headers={'Connection': 'close'},
+        )
+
+    def send_oauth_error(self, error):
+        """Send a 400 response for a constant OAuth error code"""
+        self.send_body(OAUTH_ERROR_BODIES[error], 'application/json', 400)
 
     def send_redirect(self, location):
         """Send a redirect response"""
         self.send_response(302)
         self.send_header('Location', location)
+        self.send_header('Content-Length', '0')
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
 
-    def send_html_response(self, html_content, status_code=200):
-        """Send an HTML response"""
-        self.send_response(status_code)
-        self.send_header('Content-Type', 'text/html; charset=utf-8')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(html_content.encode('utf-8'))
-
-    def get_request_body(self):
-        """Get and parse request body"""
-        content_length = int(self.headers.get('Content-Length', 0))
+    def get_request_body(self, content_length):
+        """Read and parse a request body of the length validated by do_POST"""
         if content_length > 0:
             body = self.rfile.read(content_length).decode('utf-8')
             if self.headers.get('Content-Type', '').startswith('application/x-www-form-urlencoded'):
                 return dict(urllib.parse.parse_qsl(body))
             else:
                 try:
-                    return json.loads(body)
-                except:
+                    data = json.loads(body)
+                except ValueError:
                     return dict(urllib.parse.parse_qsl(body))
+                if not isinstance(data, dict):
+                    raise ValueError("request body must be a JSON object")
+                return data
         return {}
 
+    def send_not_found(self, close=False):
+        """Send an empty 404 response"""
+        self.send_response(404)
+        self.send_header('Content-Length', '0')
+        if close:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+
+    def validate_post(self):
+        """Check a POST's route and body framing before any of the body is read
+
+        Returns (handler, content_length), or sends the rejection and returns None.
+        """
+        handler = self.POST_ROUTES.get(urlparse(self.path).path)
+        if handler is None:
+            # The body is never read, so the connection can't be reused
+            self.send_not_found(close=True)
+            return None
+
+        if 'Transfer-Encoding' in self.headers:
+            self.reject_request(411, "chunked request bodies are not supported")
+            return None
+        content_length = self.request_content_length()
+        if content_length is None:
+            self.reject_request(400, "invalid Content-Length")
+            return None
+        if content_length > MAX_BODY_SIZE:
+            self.reject_request(413, "request body too large")
+            return None
+
+        return handler, content_length
+
     def do_POST(self):
         """Handle POST requests"""
-        path = urlparse(self.path).path
+        checked = self.validate_post()
+        if checked is None:
+            return
 
-        if path == '/register':
-            self.handle_register()
-        elif path == '/token':
-            self.handle_token()
-        else:
-            self.send_response(404)
-            self.end_headers()
+        handler, content_length = checked
+        handler(self, content_length)
 
     def do_GET(self):
         """Handle GET requests"""
-        parsed_url = urlparse(self.path)
-        path = parsed_url.path
-        query_params = parse_qs(parsed_url.query)
-
-        if path == '/authorize':
-            self.handle_authorize(query_params)
-        elif path == '/.well-known/jwks.json':
-            self.handle_jwks()
-        elif path == '/.well-known/oauth-authorization-server':
-            self.handle_discovery()
-        else:
-            self.send_response(404)
-            self.end_headers()
+        if self.has_request_body():
+            self.reject_request(400, "request body not allowed")
+            return
+
+        path = urlparse(self.path).path
+
+        # Constant documents are written straight from their precomputed bytes
+        static = self.STATIC_GET_ROUTES.get(path)
+        if static is not None:
+            self.send_static_json(static)
+            return
+
+        handler = self.GET_ROUTES.get(path)
+        if handler is None:
+            self.send_not_found()
+            return
+
+        handler(self)
 
-    def handle_register(self):
+    def handle_register(self, content_length):
         """Handle client registration"""
         try:
-            body = self.get_request_body()
+            body = self.get_request_body(content_length)
             client_id = generate_id('mcp_')
             client_secret = generate_id('secret_')
 
@@ -212,9 +430,11 @@ class AuthServerHandler(BaseHTTPRequestHandler):
         except Exception as e:
             self.send_json_response({"error": "invalid_request", "error_description": str(e)}, 400)
 
-    def handle_authorize(self, query_params):
+    def handle_authorize(self):
         """Handle authorization request"""
         try:
+            query_params = parse_qs(urlparse(self.path).query)
+
             # Extract parameters (query_params values are lists)
             response_type = query_params.get('response_type', [''])[0]
             client_id = query_params.get('client_id', [''])[0]
@@ -225,7 +445,7 @@ class AuthServerHandler(BaseHTTPRequestHandler):
             scope = query_params.get('scope', [''])[0]
 
             if response_type != 'code':
-                self.send_json_response({"error": "unsupported_response_type"}, 400)
+                self.send_oauth_error('unsupported_response_type')
                 return
 
             # Allow the hardcoded client_id from the example
@@ -236,7 +456,7 @@ class AuthServerHandler(BaseHTTPRequestHandler):
                 }
 
             if client_id not in registered_clients:
-                self.send_json_response({"error": "invalid_client"}, 400)
+                self.send_oauth_error('invalid_client')
                 return
 
             # Generate authorization code
@@ -264,135 +484,23 @@ class AuthServerHandler(BaseHTTPRequestHandler):
 
     def show_authorization_page(self, client_id, callback_url):
         """Show authorization consent page with countdown"""
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>MCP Authorization</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            margin: 0;
-            padding: 0;
-            min-height: 100vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
-        .container {{
-            background: white;
-            padding: 2rem;
-            border-radius: 12px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            text-align: center;
-            max-width: 400px;
-            width: 90%;
-        }}
-        .logo {{
-            font-size: 2.5rem;
-            margin-bottom: 1rem;
-        }}
-        h1 {{
-            color: #333;
-            margin-bottom: 0.5rem;
-            font-size: 1.5rem;
-        }}
-        .subtitle {{
-            color: #666;
-            margin-bottom: 2rem;
-            font-size: 1rem;
-        }}
-        .client-info {{
-            background: #f8f9fa;
-            padding: 1rem;
-            border-radius: 8px;
-            margin: 1rem 0;
-            border-left: 4px solid #667eea;
-        }}
-        .countdown {{
-            font-size: 3rem;
-            font-weight: bold;
-            color: #667eea;
-            margin: 1.5rem 0;
-            font-family: 'Courier New', monospace;
-        }}
-        .status {{
-            color: #28a745;
-            font-weight: 500;
-            margin-top: 1rem;
-        }}
-        .spinner {{
-            display: inline-block;
-            width: 20px;
-            height: 20px;
-            border: 2px solid #f3f3f3;
-            border-top: 2px solid #667eea;
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-            margin-right: 8px;
-        }}
-        @keyframes spin {{
-            0% {{ transform: rotate(0deg); }}
-            100% {{ transform: rotate(360deg); }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="logo">🔐</div>
-        <h1>Authorization Successful</h1>
-        <p class="subtitle">MCP Authentication Server</p>
-
-        <div class="client-info">
-            <strong>Client ID:</strong><br>
-            <code>{client_id}</code>
-        </div>
-
-        <div class="status">
-            <div class="spinner"></div>
-            Authorization granted! Redirecting in...
-        </div>
-
-        <div class="countdown" id="countdown">3</div>
-
-        <p style="color: #666; font-size: 0.9rem;">
-            You will be redirected automatically to complete the authentication flow.
-        </p>
-    </div>
-
-    <script>
-        let countdown = 3;
-        const countdownElement = document.getElementById('countdown');
-
-        const timer = setInterval(() => {{
-            countdown--;
-            countdownElement.textContent = countdown;
-
-            if (countdown <= 0) {{
-                clearInterval(timer);
-                countdownElement.textContent = '0';
-                window.location.href = '{callback_url}';
-            }}
-        }}, 1000);
-
-        // Also allow manual redirect by clicking
-        document.addEventListener('click', () => {{
-            clearInterval(timer);
-            window.location.href = '{callback_url}';
-        }});
-    </script>
-</body>
-</html>
-        """
-        self.send_html_response(html_content)
-
-    def handle_token(self):
+        body = render_template(
+            AUTHORIZATION_PAGE,
+            client_id=html.escape(client_id),
+            # Embedded in a <script> block, so encode as a JS string literal
+            callback_url=json.dumps(callback_url).replace('</', '<\\/'),
+        )
+        self.send_body(body, 'text/html; charset=utf-8')
+
+    def handle_token(self, content_length):
         """Handle token request"""
         try:
-            body = self.get_request_body()
+            body = self.get_request_body(content_length)
+        except ValueError as e:
+            self.send_json_response({"error": "invalid_request", "error_description": str(e)}, 400)
+            return
+
+        try:
             grant_type = body.get('grant_type')
 
             if grant_type == 'authorization_code':
@@ -411,21 +519,17 @@ class AuthServerHandler(BaseHTTPRequestHandler):
                     except Exception:
                         pass
 
-                if code not in authorization_codes:
-                    self.send_json_response({"error": "invalid_grant"}, 400)
-                    return
-
-                code_data = authorization_codes[code]
+                # Claim the code with a single pop so concurrent redemptions of
+                # the same code can't both succeed; it's single-use either way
+                code_data = authorization_codes.pop(code, None)
 
-                if (time.time() > code_data['expires_at'] or
+                if (code_data is None or
+                    time.time() > code_data['expires_at'] or
                     code_data['client_id'] != client_id or
                     code_data['redirect_uri'] != redirect_uri):
-                    self.send_json_response({"error": "invalid_grant"}, 400)
+                    self.send_oauth_error('invalid_grant')
                     return
 
-                # Clean up authorization code
-                del authorization_codes[code]
-
                 # Create tokens
                 now = int(time.time())
                 access_token_id = generate_id('access_')
@@ -457,8 +561,8 @@ class AuthServerHandler(BaseHTTPRequestHandler):
                     "type": "refresh"
                 }
 
-                access_token = create_jwt_with_openssl(access_token_payload)
-                refresh_token = create_jwt_with_openssl(refresh_token_payload)
+                access_token = create_jwt_with_openssl(access_token_payload, self.server.private_key_path)
+                refresh_token = create_jwt_with_openssl(refresh_token_payload, self.server.private_key_path)
 
                 # Store tokens
                 tokens[access_token_id] = {"token": access_token, "payload": access_token_payload}
@@ -495,7 +599,7 @@ class AuthServerHandler(BaseHTTPRequestHandler):
                     "type": "access"
                 }
 
-                new_access_token = create_jwt_with_openssl(new_access_token_payload)
+                new_access_token = create_jwt_with_openssl(new_access_token_payload, self.server.private_key_path)
                 tokens[new_access_token_id] = {"token": new_access_token, "payload": new_access_token_payload}
 
                 response = {
@@ -508,40 +612,53 @@ class AuthServerHandler(BaseHTTPRequestHandler):
                 self.send_json_response(response)
 
             else:
-                self.send_json_response({"error": "unsupported_grant_type"}, 400)
+                self.send_oauth_error('unsupported_grant_type')
 
         except Exception as e:
             self.send_json_response({"error": "server_error", "error_description": str(e)}, 500)
 
-    def handle_jwks(self):
-        """Handle JWKS request"""
-        jwks = {
-            "keys": [PUBLIC_KEY_JWK]
-        }
-        self.send_json_response(jwks)
-
-    def handle_discovery(self):
-        """Handle OAuth discovery endpoint"""
-        discovery = {
-            "issuer": "http://localhost:9000",
-            "authorization_endpoint": "http://localhost:9000/authorize",
-            "token_endpoint": "http://localhost:9000/token",
-            "jwks_uri": "http://localhost:9000/.well-known/jwks.json",
-            "registration_endpoint": "http://localhost:9000/register",
-            "response_types_supported": ["code"],
-            "grant_types_supported": ["authorization_code", "refresh_token"],
-            "token_endpoint_auth_methods_supported": ["client_secret_basic", "client_secret_post"],
-            "code_challenge_methods_supported": ["S256"]
-        }
-        self.send_json_response(discovery)
-
     def log_message(self, format, *args):
         """Override to provide cleaner logging"""
         print(f"[{self.address_string()}] {format % args}")
 
+    # Exact-match routing tables: a single dict lookup per request
+    STATIC_GET_ROUTES = {
+        '/.well-known/jwks.json': JWKS_BODY,
+        '/.well-known/oauth-authorization-server': DISCOVERY_BODY,
+    }
+    GET_ROUTES = {
+        '/authorize': handle_authorize,
+    }
+    POST_ROUTES = {
+        '/register': handle_register,
+        '/token': handle_token,
+    }
+
+# Handle each connection on its own thread so a slow client (or an openssl
+# signing call) doesn't stall every other request
+class AuthServer(ThreadingHTTPServer):
+    def __init__(self, server_address, RequestHandlerClass=AuthServerHandler):
+        # Write the signing key once at startup rather than on every token
+        # request; written first so server_close can clean up a failed bind
+        self.private_key_path = write_private_key()
+        super().__init__(server_address, RequestHandlerClass)
+
+    def server_close(self):
+        """Close the listening socket and remove the signing key file"""
+        super().server_close()
+        if self.private_key_path is not None:
+            os.remove(self.private_key_path)
+            self.private_key_path = None
+
 def main():
     port = 9000
-    server = HTTPServer(('localhost', port), AuthServerHandler)
+    server = AuthServer(('localhost', port))
+
+    # pkill and service managers stop us with SIGTERM, which would otherwise
+    # exit without running the finally below and leave the key file behind
+    def handle_sigterm(signum, frame):
+        raise SystemExit(0)
+    signal.signal(signal.SIGTERM, handle_sigterm)
 
     print(f"MCP Authorization Server running on http://localhost:{port}")
     print("Using RSA RS256 for JWT signing with OpenSSL")
@@ -558,6 +675,8 @@ def main():
     except KeyboardInterrupt:
         print("\nShutting down server...")
         server.shutdown()
+    finally:
+        server.server_close()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file